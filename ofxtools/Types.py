@@ -71,6 +71,11 @@ class Element:
     __get__ and __set__ and redirect them to a defaultdict keyed by the calling
     parent, where values are the data passed to that Element).
 
+    Because values are keyed only by the parent instance, an Element instance
+    must not be bound to more than one attribute of a model class - e.g.
+    ``MAIL.incimages`` and ``MAIL.usehtml`` each need their own ``Bool()``, or
+    setting one would overwrite the other.
+
     Prior to setting the data value, each Element Performs validation
     (using the arguments passed to __init__()) and type conversion (using the
     logic implemented in convert()).
@@ -250,17 +255,26 @@ class NagString(String):
     strict = False
 
 
+@functools.lru_cache(maxsize=None)
+def _choices(args: tuple) -> frozenset:
+    """
+    Intern the valid values for ``OneOf``, so that the many model attributes
+    declared as e.g. ``OneOf(*CURRENCY_CODES)`` share a single frozenset.
+    """
+    return frozenset(args)
+
+
 class OneOf(Element):
     type = str
 
     def _init(self, *args, **kwargs):
-        self.valid = set(args)
+        self.valid = _choices(args)
         super()._init(**kwargs)
 
     def _convert_default(self, value):
         value = self.enforce_required(value)
         if value is not None and value not in self.valid:
-            raise OFXSpecError(f"'{value}' is not OneOf {self.valid}")
+            raise OFXSpecError(f"'{value}' is not OneOf {set(self.valid)}")
         return value
 
     def _convert_str(self, value):
@@ -271,7 +285,7 @@ class OneOf(Element):
     def _unconvert_default(self, value):
         value = self.enforce_required(value)
         if value is not None and value not in self.valid:
-            raise OFXSpecError(f"'{value}' is not OneOf {self.valid}")
+            raise OFXSpecError(f"'{value}' is not OneOf {set(self.valid)}")
         return value
 
 
@@ -23,7 +23,6 @@ __all__ = ["Aggregate", "SubAggregate", "Unsupported", "ElementList"]
 
 # stdlib imports
 import xml.etree.ElementTree as ET
-from copy import deepcopy
 from typing import (
     Any,
     Dict,
@@ -41,7 +40,7 @@ import logging
 # local imports
 from ofxtools.Types import Element, ListItem, ListElement
 import ofxtools.models
-from ofxtools.utils import classproperty, pairwise, partition
+from ofxtools.utils import cached_classproperty, pairwise, partition
 
 
 logger = logging.getLogger(__name__)
@@ -139,9 +138,10 @@ class Aggregate(list):
 
     def _apply_args(self, *args: "Aggregate") -> None:
         # Interpret positional args as contained list items (of variable #)
+        listitems = self.listitems
         for member in args:
             arg = member.__class__.__name__.lower()
-            if arg not in self.listitems:
+            if arg not in listitems:
                 clsnm = self.__class__.__name__
                 msg = f"{clsnm} can't contain {arg} as list item: {member}"
                 raise TypeError(msg)
@@ -173,12 +173,14 @@ class Aggregate(list):
         if not isinstance(elem, ET.Element):
             msg = f"Bad type {type(elem)} - should be xml.etree.ElementTree.Element"
             raise TypeError(msg)
-        try:
-            SubClass = getattr(ofxtools.models, elem.tag)
-        except AttributeError:
+        # The ``ofxtools.models`` namespace serves as the registry of
+        # Aggregate subclasses, but it also exports other ALL CAPS names
+        # (e.g. ``ofxtools.models.CURRENCY_CODES``) that must not be dispatched.
+        SubClass = getattr(ofxtools.models, elem.tag, None)
+        if not (isinstance(SubClass, type) and issubclass(SubClass, Aggregate)):
             raise OFXSpecError(f"ofxtools.models doesn't define {elem.tag}")
 
-        logger.info(f"Converting <{elem.tag}> to {SubClass.__name__}")
+        logger.info("Converting <%s> to %s", elem.tag, SubClass.__name__)
         instance = SubClass._convert(elem)
         return instance
 
@@ -196,8 +198,9 @@ class Aggregate(list):
         # Hook to modify incoming ``ET.Element`` before conversion
         elem = cls.groom(elem)
 
-        spec = list(cls.spec)
+        spec = cls._spec_index
         listitems = cls.listitems
+        unsupported = cls.unsupported
 
         def extractArgs(elem: ET.Element) -> Tuple[Tuple[str, Any], Tuple[int, Any]]:
             """
@@ -206,12 +209,14 @@ class Aggregate(list):
             """
             key = elem.tag.lower()
             try:
-                index = spec.index(key)
-            except ValueError:
+                specIndex = spec[key]
+            except KeyError:
                 clsnm = cls.__name__
-                raise OFXSpecError(f"{clsnm}.spec = {spec}; does not contain {key}")
+                raise OFXSpecError(
+                    f"{clsnm}.spec = {list(spec)}; does not contain {key}"
+                )
 
-            if key in cls.unsupported:
+            if key in unsupported:
                 value: Optional[Union[str, Aggregate]] = None
             elif elem.text:
                 # Element - extract raw text string; it will be type converted
@@ -221,7 +226,7 @@ class Aggregate(list):
                 # Aggregate - perform type conversion
                 value = Aggregate.from_etree(elem)
 
-            return (key, value), (index, key in listitems)
+            return (key, value), specIndex
 
         def outOfOrder(index0: Tuple[int, bool], index1: Tuple[int, bool]) -> bool:
             """
@@ -236,7 +241,9 @@ class Aggregate(list):
 
         args_, specIndices = zip(*[extractArgs(subelem) for subelem in elem])
         clsnm = cls.__name__
-        logger.debug(f"Args to instantiate {clsnm}: {args_}")
+        # N.B. let logging format lazily; repr() of args_ recursively walks
+        # every Aggregate converted so far.
+        logger.debug("Args to instantiate %s: %s", clsnm, args_)
         if any(
             [outOfOrder(index0, index1) for index0, index1 in pairwise(specIndices)]
         ):
@@ -254,17 +261,26 @@ class Aggregate(list):
 
         Extend in subclass.
 
-        N.B. make sure to perform modifications on a copy.deepcopy(), in order
-        to keep the input free of side effects!
+        N.B. make sure to perform modifications on a copy (a shallow copy
+        will do, e.g. ``ofxtools.utils.retag_child()``), in order to keep the
+        input free of side effects!
         """
-        elem = deepcopy(elem)
+        # Fast path - nothing to remove, so no need to copy
+        if not any("." in child.tag for child in elem):
+            return elem
 
-        for child in set(elem):
+        # Rather than deep-copying and then removing children one at a time,
+        # make a shallow copy that just skips them.  The SubElements that are
+        # kept aren't modified, so they can be shared with the input.
+        groomed = ET.Element(elem.tag, elem.attrib)
+        groomed.text, groomed.tail = elem.text, elem.tail
+        for child in elem:
             if "." in child.tag:
-                logger.debug(f"Removing extended tag <{child.tag}>")
-                elem.remove(child)
+                logger.debug("Removing extended tag <%s>", child.tag)
+            else:
+                groomed.append(child)
 
-        return elem
+        return groomed
 
     def to_etree(self) -> ET.Element:
         """
@@ -310,12 +326,13 @@ class Aggregate(list):
 
         Override in subclass.
 
-        N.B. make sure to perform modifications on a copy.deepcopy(), in order
-        to keep the input free of side effects.
+        N.B. make sure to perform modifications on a copy (a shallow copy
+        will do, e.g. ``ofxtools.utils.retag_child()``), in order to keep the
+        input free of side effects.
         """
         return elem
 
-    @classproperty
+    @cached_classproperty
     @classmethod
     def _superdict(cls) -> Mapping[str, Any]:
         """
@@ -336,7 +353,7 @@ class Aggregate(list):
         """
         return {k: v for k, v in cls._superdict.items() if predicate(v)}
 
-    @classproperty
+    @cached_classproperty
     @classmethod
     def spec(cls) -> Mapping[str, Union[Element, "Unsupported"]]:
         """
@@ -346,7 +363,18 @@ class Aggregate(list):
         """
         return cls._filter_attrs(lambda v: isinstance(v, (Element, Unsupported)))
 
-    @classproperty
+    @cached_classproperty
+    @classmethod
+    def _spec_index(cls) -> Mapping[str, Tuple[int, bool]]:
+        """
+        Map each attribute name in ``spec`` to its position in the class
+        definition and whether it's a ListItem, so ``_convert()`` can place
+        each SubElement with a single dict lookup.
+        """
+        listitems = cls.listitems
+        return {name: (index, name in listitems) for index, name in enumerate(cls.spec)}
+
+    @cached_classproperty
     @classmethod
     def spec_no_listitems(cls) -> Mapping[str, Union[Element, "Unsupported"]]:
         """
@@ -358,7 +386,7 @@ class Aggregate(list):
             and not isinstance(v, (ListItem, ListElement))
         )
 
-    @classproperty
+    @cached_classproperty
     @classmethod
     def elements(cls) -> Mapping[str, Element]:
         """
@@ -368,7 +396,7 @@ class Aggregate(list):
             lambda v: isinstance(v, Element) and not isinstance(v, SubAggregate)
         )
 
-    @classproperty
+    @cached_classproperty
     @classmethod
     def subaggregates(cls) -> Mapping[str, "SubAggregate"]:
         """
@@ -376,7 +404,7 @@ class Aggregate(list):
         """
         return cls._filter_attrs(lambda v: isinstance(v, SubAggregate))
 
-    @classproperty
+    @cached_classproperty
     @classmethod
     def unsupported(cls) -> Mapping[str, "Unsupported"]:
         """
@@ -384,7 +412,7 @@ class Aggregate(list):
         """
         return cls._filter_attrs(lambda v: isinstance(v, Unsupported))
 
-    @classproperty
+    @cached_classproperty
     @classmethod
     def listitems(cls) -> Mapping[str, ListItem]:
         """
@@ -484,7 +512,7 @@ class ElementList(Aggregate):
     Aggregate whose sequence contents are ListElements instead of ListItems
     """
 
-    @classproperty
+    @cached_classproperty
     @classmethod
     def listitems(cls) -> Mapping[str, ListElement]:
         """
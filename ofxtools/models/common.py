@@ -22,7 +22,7 @@ from ofxtools.models.base import Aggregate, SubAggregate, ElementList
 from ofxtools.models.i18n import CURRENCY, LANG_CODES
 
 
-SVCSTATUSES = ["AVAIL", "PEND", "ACTIVE"]
+SVCSTATUSES = ("AVAIL", "PEND", "ACTIVE")
 
 
 class STATUS(Aggregate):
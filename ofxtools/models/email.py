@@ -24,7 +24,6 @@ __all__ = [
 
 
 # stdlib imports
-from copy import deepcopy
 import logging
 
 
@@ -33,6 +32,7 @@ from ofxtools.Types import Bool, String, DateTime, ListItem
 from ofxtools.models.base import Aggregate, SubAggregate
 from ofxtools.models.wrapperbases import TrnRq, TrnRs, SyncRqList, SyncRsList
 from ofxtools.models.common import MSGSETCORE
+from ofxtools.utils import retag_child
 
 
 logger = logging.getLogger(__name__)
@@ -55,13 +55,12 @@ class MAIL(Aggregate):
         """
         Rename all Elements tagged FROM (reserved Python keyword) to FROM
         """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        frm = elem.find("./FROM")
+        # N.B. ``Aggregate.from_etree()`` may be handed a bare <MAIL>, so the
+        # rename has to live here, not in a document-wide pass in OFXTree
+        frm = next((child for child in elem if child.tag == "FROM"), None)
         if frm is not None:
             logger.debug("Renaming <FROM> to <FRM>")
-            frm.tag = "FRM"
+            elem = retag_child(elem, frm, "FRM")
 
         return super(MAIL, MAIL).groom(elem)
 
@@ -70,13 +69,10 @@ class MAIL(Aggregate):
         """
         Rename FRM back to FROM
         """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        frm = elem.find("./FRM")
+        frm = next((child for child in elem if child.tag == "FRM"), None)
         if frm is not None:
             logger.debug("Renaming <FRM> to <FROM>")
-            frm.tag = "FROM"
+            elem = retag_child(elem, frm, "FROM")
 
         return super(MAIL, MAIL).ungroom(elem)
 
@@ -26,7 +26,6 @@ __all__ = [
 
 
 # stdlib imports
-from copy import deepcopy
 import logging
 
 
@@ -43,6 +42,7 @@ from ofxtools.Types import (
 from ofxtools.models.base import Aggregate, SubAggregate
 from ofxtools.models.wrapperbases import TrnRq, TrnRs
 from ofxtools.models.i18n import CURRENCY
+from ofxtools.utils import retag_child
 
 
 logger = logging.getLogger(__name__)
@@ -159,13 +159,10 @@ class MFINFO(Aggregate):
         """
         Rename all Elements tagged YIELD (reserved Python keyword) to YLD
         """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YIELD")
+        yld = next((child for child in elem if child.tag == "YIELD"), None)
         if yld is not None:
             logger.debug("Renaming <YIELD> to <YLD>")
-            yld.tag = "YLD"
+            elem = retag_child(elem, yld, "YLD")
 
         return super(MFINFO, MFINFO).groom(elem)
 
@@ -174,13 +171,10 @@ class MFINFO(Aggregate):
         """
         Rename YLD back to YIELD
         """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YLD")
+        yld = next((child for child in elem if child.tag == "YLD"), None)
         if yld is not None:
             logger.debug("Renaming <YLD> to <YIELD>")
-            yld.tag = "YIELD"
+            elem = retag_child(elem, yld, "YIELD")
 
         return super(MFINFO, MFINFO).ungroom(elem)
 
@@ -223,13 +217,10 @@ class STOCKINFO(Aggregate):
         """
         Rename all Elements tagged YIELD (reserved Python keyword) to YLD
         """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YIELD")
+        yld = next((child for child in elem if child.tag == "YIELD"), None)
         if yld is not None:
             logger.debug("Renaming <YIELD> to <YLD>")
-            yld.tag = "YLD"
+            elem = retag_child(elem, yld, "YLD")
 
         return super(STOCKINFO, STOCKINFO).groom(elem)
 
@@ -238,13 +229,10 @@ class STOCKINFO(Aggregate):
         """
         Rename YLD back to YIELD
         """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YLD")
+        yld = next((child for child in elem if child.tag == "YLD"), None)
         if yld is not None:
             logger.debug("Renaming <YLD> to <YIELD>")
-            yld.tag = "YIELD"
+            elem = retag_child(elem, yld, "YIELD")
 
         return super(STOCKINFO, STOCKINFO).ungroom(elem)
 
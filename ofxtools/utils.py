@@ -8,6 +8,7 @@ import itertools
 import xml.etree.ElementTree as ET
 from typing import Any, Optional, Tuple, Callable, Iterable, Sequence
 import math
+import weakref
 
 
 # local imports
@@ -21,6 +22,27 @@ class classproperty(property):
         return self.fget.__get__(None, owner)()
 
 
+class cached_classproperty(classproperty):
+    """
+    Decorator that turns a classmethod into a property, computed once per
+    class and thereafter looked up from a cache.
+
+    N.B. the cached value won't notice class attributes added after it's been
+    computed, so use only for things fixed by the class definition.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def __get__(self, cls, owner):
+        try:
+            return self.cache[owner]
+        except KeyError:
+            value = self.cache[owner] = super().__get__(cls, owner)
+            return value
+
+
 def fixpath(path: str) -> str:
     """Makes paths do the right thing."""
     path = os.path.expanduser(path)
@@ -119,6 +141,26 @@ def indent(elem: ET.Element, level: int = 0) -> None:
             elem.tail = i
 
 
+def retag_child(elem: ET.Element, child: ET.Element, tag: str) -> ET.Element:
+    """
+    Return a shallow copy of ``elem`` with ``child`` replaced by a copy of
+    itself retagged as ``tag``.
+
+    Other SubElements are shared with the input rather than deep-copied;
+    they're not modified, so the input is still kept free of side effects.
+    """
+    clone = ET.Element(elem.tag, elem.attrib)
+    clone.text, clone.tail = elem.text, elem.tail
+    for subelem in elem:
+        if subelem is child:
+            renamed = ET.Element(tag, child.attrib)
+            renamed.text, renamed.tail = child.text, child.tail
+            renamed.extend(child)
+            subelem = renamed
+        clone.append(subelem)
+    return clone
+
+
 # FIXME - this doesn't work quite right
 def tostring_unclosed_elements(elem: ET.Element) -> bytes:
     """
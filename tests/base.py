@@ -13,10 +13,23 @@ from ofxtools.Types import ListItem, ListElement
 import ofxtools.models
 from ofxtools.models.base import Aggregate, SubAggregate
 from ofxtools.models.common import STATUS
-from ofxtools.utils import classproperty, indent
+from ofxtools.utils import cached_classproperty, classproperty, indent
 from ofxtools.Parser import OFXTree, TreeBuilder
 
 
+class cached_etree(cached_classproperty):
+    """
+    Decorator for ``etree`` fixtures that builds the tree once per class,
+    then hands out deep copies of it.
+
+    Copying an existing tree is much cheaper than rebuilding it from nested
+    ``SubElement()`` calls, and each caller still gets its own tree to mutate.
+    """
+
+    def __get__(self, cls, owner):
+        return deepcopy(super().__get__(cls, owner))
+
+
 class TestAggregate:
     __test__ = False
 
@@ -54,7 +67,7 @@ class TestAggregate:
     def testRequired(self):
         if self.requiredElements:
             for tag in self.requiredElements:
-                etree = deepcopy(self.etree)
+                etree = self.etree
                 child = etree.find(tag)
                 try:
                     etree.remove(child)
@@ -67,7 +80,7 @@ class TestAggregate:
     def testOptional(self):
         if self.optionalElements:
             for tag in self.optionalElements:
-                etree = deepcopy(self.etree)
+                etree = self.etree
                 child = etree.find(tag)
                 try:
                     etree.remove(child)
@@ -77,22 +90,22 @@ class TestAggregate:
                 Aggregate.from_etree(etree)
 
     def testExtraElement(self):
-        etree = deepcopy(self.etree)
+        etree = self.etree
         ET.SubElement(etree, "FAKEELEMENT").text = "garbage"
         with self.assertRaises(ValueError):
             Aggregate.from_etree(etree)
 
     def oneOfTest(self, tag, texts):
         # Make sure OneOf validator allows all legal values and disallows
-        # illegal values
+        # illegal values.  ``self.etree`` is a fresh tree and from_etree()
+        # doesn't modify its input, so rewrite the same target for each value
+        # instead of copying the whole tree per value.
+        etree = self.etree
+        target = etree.find(".//%s" % tag)
         for text in texts:
-            etree = deepcopy(self.etree)
-            target = etree.find(".//%s" % tag)
             target.text = text
             Aggregate.from_etree(etree)
 
-        etree = deepcopy(self.etree)
-        target = etree.find(".//%s" % tag)
         target.text = "garbage"
         with self.assertRaises(ValueError):
             Aggregate.from_etree(etree)
@@ -160,7 +173,7 @@ class StatusTestCase(unittest.TestCase, TestAggregate):
     optionalElements = ["MESSAGE"]
     oneOfs = {"SEVERITY": ("INFO", "WARN", "ERROR")}
 
-    @classproperty
+    @cached_etree
     @classmethod
     def etree(cls):
         etree = ET.Element("STATUS")
@@ -194,7 +207,7 @@ class TrnrqTestCase(TestAggregate):
     def wrapped(cls):
         return cls.wraps().etree
 
-    @classproperty
+    @cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -278,7 +291,7 @@ class TrnrsTestCase(TestAggregate):
     def wrapped(cls):
         return cls.wraps().etree
 
-    @classproperty
+    @cached_etree
     @classmethod
     def etree(self):
         return next(self.validSoup)
@@ -351,7 +364,7 @@ class TranlistTestCase(TestAggregate):
 
     requiredElements = ["DTSTART", "DTEND"]
 
-    @classproperty
+    @cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -382,7 +395,7 @@ class SyncrqTestCase(TestAggregate):
     requiredElements = ["REJECTIFMISSING"]
     mutexes = [("TOKEN", "DEADBEEF"), ("TOKENONLY", "Y"), ("REFRESH", "N")]
 
-    @classproperty
+    @cached_etree
     @classmethod
     def etree(self):
         # Use the first return value for TestAggregate test methods
@@ -443,7 +456,7 @@ class SyncrsTestCase(TestAggregate):
     requiredElements = ["TOKEN"]
     optionalElements = ["LOSTSYNC"]
 
-    @classproperty
+    @cached_etree
     @classmethod
     def etree(self):
         return next(self.validSoup)
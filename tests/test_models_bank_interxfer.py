@@ -34,7 +34,7 @@ class InterrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["XFERINFO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INTERRQ")
@@ -93,7 +93,7 @@ class InterrsTestCase(unittest.TestCase, base.TestAggregate):
 
         yield root
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -116,7 +116,7 @@ class IntermodrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID", "XFERINFO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INTERMODRQ")
@@ -135,7 +135,7 @@ class IntercanrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INTERCANRQ")
@@ -153,7 +153,7 @@ class IntermodrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID", "XFERINFO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INTERMODRS")
@@ -177,7 +177,7 @@ class IntercanrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INTERCANRS")
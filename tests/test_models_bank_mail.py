@@ -32,7 +32,7 @@ class BankmailrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["MAIL"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -84,7 +84,7 @@ class BankmailrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["MAIL"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -137,7 +137,7 @@ class ChkmailrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["BANKACCTFROM", "MAIL", "CHECKNUM"]
     optionalElements = ["TRNAMT", "DTUSER", "FEE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         bankacctfrom = bk_stmt.BankacctfromTestCase.etree
@@ -172,7 +172,7 @@ class DepmailrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["BANKACCTFROM", "MAIL", "TRNAMT"]
     optionalElements = ["DTUSER", "FEE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         bankacctfrom = bk_stmt.BankacctfromTestCase.etree
@@ -46,7 +46,7 @@ class RecurrinstTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["NINSTS"]
     oneOfs = {"FREQ": FREQUENCIES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECURRINST")
@@ -65,7 +65,7 @@ class RecintrarqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECURRINST", "INTRARQ"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECINTRARQ")
@@ -87,7 +87,7 @@ class RecintrarsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECSRVRTID", "RECURRINST", "INTRARS"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECINTRARS")
@@ -111,7 +111,7 @@ class RecintramodrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECSRVRTID", "RECURRINST", "INTRARQ", "MODPENDING"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECINTRAMODRQ")
@@ -137,7 +137,7 @@ class RecintramodrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECSRVRTID", "RECURRINST", "INTRARS", "MODPENDING"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECINTRAMODRS")
@@ -163,7 +163,7 @@ class RecintracanrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECSRVRTID", "CANPENDING"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECINTRACANRQ")
@@ -182,7 +182,7 @@ class RecintracanrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECSRVRTID", "CANPENDING"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECINTRACANRS")
@@ -349,7 +349,7 @@ class RecinterrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECURRINST", "INTERRQ"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECINTERRQ")
@@ -372,7 +372,7 @@ class RecinterrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECSRVRTID", "RECURRINST", "INTERRS"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECINTERRS")
@@ -396,7 +396,7 @@ class RecintermodrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECSRVRTID", "RECURRINST", "INTERRQ", "MODPENDING"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECINTERMODRQ")
@@ -422,7 +422,7 @@ class RecintermodrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECSRVRTID", "RECURRINST", "INTERRS", "MODPENDING"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECINTERMODRS")
@@ -448,7 +448,7 @@ class RecintercanrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECSRVRTID", "CANPENDING"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECINTERCANRQ")
@@ -467,7 +467,7 @@ class RecintercanrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECSRVRTID", "CANPENDING"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RECINTERCANRS")
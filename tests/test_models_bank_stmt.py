@@ -56,7 +56,7 @@ class BankacctfromTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["BRANCHID", "ACCTKEY"]
     oneOf = {"ACCTTYPE": ("CHECKING", "SAVINGS", "MONEYMRKT", "CREDITLINE", "CD")}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("BANKACCTFROM")
@@ -86,7 +86,7 @@ class BankaccttoTestCase(BankacctfromTestCase):
     optionalElements = ["BRANCHID", "ACCTKEY"]
     oneOf = {"ACCTTYPE": ("CHECKING", "SAVINGS", "MONEYMRKT", "CREDITLINE", "CD")}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("BANKACCTTO")
@@ -115,7 +115,7 @@ class BankacctinfoTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["BANKACCTFROM", "SUPTXDL", "XFERSRC", "XFERDEST", "SVCSTATUS"]
     oneOfs = {"SVCSTATUS": SVCSTATUSES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("BANKACCTINFO")
@@ -144,7 +144,7 @@ class CcacctfromTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["ACCTID"]
     optionalElements = ["ACCTKEY"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CCACCTFROM")
@@ -164,7 +164,7 @@ class CcaccttoTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["ACCTID"]
     optionalElements = ["ACCTKEY"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CCACCTTO")
@@ -184,7 +184,7 @@ class CcacctinfoTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["CCACCTFROM", "SUPTXDL", "XFERSRC", "XFERDEST", "SVCSTATUS"]
     oneOfs = {"SVCSTATUS": SVCSTATUSES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CCACCTINFO")
@@ -213,7 +213,7 @@ class InctranTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["INCLUDE"]
     optionalElements = ["DTSTART", "DTEND"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INCTRAN")
@@ -238,7 +238,7 @@ class StmtrqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["BANKACCTFROM"]
     optionalElements = ["INCTRAN", "INCLUDEPENDING", "INCTRANIMG"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("STMTRQ")
@@ -265,7 +265,7 @@ class PayeeTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["NAME", "ADDR1", "CITY", "STATE", "POSTALCODE", "PHONE"]
     optionalElements = ["ADDR2", "ADDR3", "COUNTRY"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PAYEE")
@@ -369,7 +369,7 @@ class StmttrnTestCase(unittest.TestCase, base.TestAggregate):
 
         return root
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = cls.emptyBase
@@ -486,7 +486,7 @@ class StmttrnTestCase(unittest.TestCase, base.TestAggregate):
 class BanktranlistTestCase(unittest.TestCase, base.TranlistTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = super().etree
@@ -521,7 +521,7 @@ class LedgerbalTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["BALAMT", "DTASOF"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("LEDGERBAL")
@@ -543,7 +543,7 @@ class AvailbalTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["BALAMT", "DTASOF"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("AVAILBAL")
@@ -577,7 +577,7 @@ class BallistTestCase(unittest.TestCase, base.TestAggregate):
         with self.assertRaises(ValueError):
             Aggregate.from_etree(root)
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("BALLIST")
@@ -605,7 +605,7 @@ class StmtrsTestCase(unittest.TestCase, base.TestAggregate):
     ]
     #  unsupported = ["banktranlistp"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("STMTRS")
@@ -689,7 +689,7 @@ class StmttrnrsTestCase(unittest.TestCase, base.TrnrsTestCase):
 class RewardinfoTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("REWARDINFO")
@@ -712,7 +712,7 @@ class CcstmtrqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["CCACCTFROM"]
     optionalElements = ["INCTRAN", "INCLUDEPENDING", "INCTRANIMG"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CCSTMTRQ")
@@ -749,7 +749,7 @@ class CcstmtrsTestCase(unittest.TestCase, base.TestAggregate):
     ]
     #  unsupported = ["banktranlistp"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CCSTMTRS")
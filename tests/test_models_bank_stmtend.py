@@ -49,7 +49,7 @@ class ClosingTestCase(unittest.TestCase, base.TestAggregate):
         "CURRENCY",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CLOSING")
@@ -98,7 +98,7 @@ class StmtendrqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["BANKACCTFROM"]
     optionalElements = ["DTSTART", "DTEND"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("STMTENDRQ")
@@ -124,7 +124,7 @@ class StmtendrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["CURDEF", "BANKACCTFROM"]
     optionalElements = ["CLOSING"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("STMTENDRS")
@@ -182,7 +182,7 @@ class StmtendtrnrsTestCase(unittest.TestCase, base.TrnrsTestCase):
 class LastpmtinfoTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("LASTPMTINFO")
@@ -228,7 +228,7 @@ class CcclosingTestCase(unittest.TestCase, base.TestAggregate):
     ]
     unsupported = ["imagedata"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CCCLOSING")
@@ -305,7 +305,7 @@ class CcstmtendrqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["CCACCTFROM"]
     optionalElements = ["DTSTART", "DTEND", "INCSTMTIMG"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CCSTMTENDRQ")
@@ -334,7 +334,7 @@ class CcstmtendrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["CURDEF", "CCACCTFROM"]
     optionalElements = ["CCCLOSING"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CCSTMTENDRS")
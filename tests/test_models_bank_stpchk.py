@@ -35,7 +35,7 @@ class ChkrangeTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["CHKNUMSTART"]
     optionalElements = ["CHKNUMEND"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CHKRANGE")
@@ -55,7 +55,7 @@ class ChkdescTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["NAME"]
     optionalElements = ["CHKNUM", "DTUSER", "TRNAMT"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CHKDESC")
@@ -81,7 +81,7 @@ class StpchkrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["BANKACCTFROM"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -136,7 +136,7 @@ class StpchknumTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["NAME", "DTUSER", "TRNAMT", "CHKERROR"]
     oneOfs = {"CHKSTATUS": ["0", "1", "100", "101"]}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -194,7 +194,7 @@ class StpchkrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["CURDEF", "BANKACCTFROM", "FEE", "FEEMSG"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("STPCHKRS")
@@ -45,7 +45,7 @@ class StpchksyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 
     requiredElements = base.SyncrqTestCase.requiredElements + ["BANKACCTFROM"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("STPCHKSYNCRQ")
@@ -115,7 +115,7 @@ class StpchksyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
 
     requiredElements = base.SyncrsTestCase.requiredElements + ["BANKACCTFROM"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("STPCHKSYNCRS")
@@ -187,7 +187,7 @@ class StpchksyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
 class IntrasyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("INTRASYNCRQ")
@@ -279,7 +279,7 @@ class IntrasyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 class IntrasyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("INTRASYNCRS")
@@ -371,7 +371,7 @@ class IntrasyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
 class IntersyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("INTERSYNCRQ")
@@ -463,7 +463,7 @@ class IntersyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 class IntersyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("INTERSYNCRS")
@@ -557,7 +557,7 @@ class WiresyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 
     requiredElements = ["REJECTIFMISSING", "BANKACCTFROM"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("WIRESYNCRQ")
@@ -628,7 +628,7 @@ class WiresyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 class WiresyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("WIRESYNCRS")
@@ -706,7 +706,7 @@ class RecintrasyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 
     requiredElements = ["REJECTIFMISSING", "BANKACCTFROM"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("RECINTRASYNCRQ")
@@ -773,7 +773,7 @@ class RecintrasyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 class RecintrasyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("RECINTRASYNCRS")
@@ -846,7 +846,7 @@ class RecintersyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 
     requiredElements = ["REJECTIFMISSING", "BANKACCTFROM"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("RECINTERSYNCRQ")
@@ -913,7 +913,7 @@ class RecintersyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 class RecintersyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("RECINTERSYNCRS")
@@ -991,7 +991,7 @@ class BankmailsyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
         "BANKACCTFROM",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("BANKMAILSYNCRQ")
@@ -1066,7 +1066,7 @@ class BankmailsyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 class BankmailsyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = Element("BANKMAILSYNCRS")
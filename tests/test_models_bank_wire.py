@@ -36,7 +36,7 @@ class WirebeneficiaryTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["NAME", "BANKACCTTO"]
     optionalElements = ["MEMO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -72,7 +72,7 @@ class ExtbankdescTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["ADDR2", "ADDR3", "COUNTRY", "PHONE"]
     oneOfs = {"COUNTRY": COUNTRY_CODES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -120,7 +120,7 @@ class WiredestbankTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["EXTBANKDESC"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("WIREDESTBANK")
@@ -140,7 +140,7 @@ class WirerqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["BANKACCTFROM", "WIREBENEFICIARY", "TRNAMT"]
     optionalElements = ["WIREDESTBANK", "DTDUE", "PAYINSTRUCT"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("WIRERQ")
@@ -178,7 +178,7 @@ class WirersTestCase(unittest.TestCase, base.TestAggregate):
     ]
     optionalElements = ["WIREDESTBANK", "DTDUE", "PAYINSTRUCT", "FEE", "CONFMSG"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -255,7 +255,7 @@ class WirecanrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("WIRECANRQ")
@@ -274,7 +274,7 @@ class WirecanrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("WIRECANRS")
@@ -39,7 +39,7 @@ class XferinfoTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["TRNAMT"]
     optionalElements = ["DTDUE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -125,7 +125,7 @@ class XferprcstsTestCase(unittest.TestCase, base.TestAggregate):
         ]
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("XFERPRCSTS")
@@ -146,7 +146,7 @@ class IntrarqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["XFERINFO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INTRARQ")
@@ -166,7 +166,7 @@ class IntrarsTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["RECSRVRTID", "XFERPRCSTS"]
     oneOfs = {"CURDEF": CURRENCY_CODES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INTRARS")
@@ -234,7 +234,7 @@ class IntramodrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID", "XFERINFO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INTRAMODRQ")
@@ -253,7 +253,7 @@ class IntracanrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INTRACANRQ")
@@ -271,7 +271,7 @@ class IntramodrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID", "XFERINFO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INTRAMODRS")
@@ -295,7 +295,7 @@ class IntracanrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INTRACANRS")
@@ -2,6 +2,7 @@
 """ Unit tests for models/base.py """
 # stdlib imports
 import unittest
+import weakref
 import xml.etree.ElementTree as ET
 
 
@@ -94,6 +95,14 @@ class AggregateTestCase(unittest.TestCase):
                 metadata="foo", testsubaggregate="foo", req00=True, req11=False
             )
 
+    def testInstanceAttributes(self):
+        # Aggregates support weak references and ad-hoc attributes
+        # (cf. trnuid/cltcookie stapled onto *STMTRS by *MSGSRSV1.statements)
+        instance = self.instance_no_subagg
+        self.assertIs(weakref.ref(instance)(), instance)
+        instance.note = 1
+        self.assertEqual(instance.note, 1)
+
     def testInitWithTooManyArgs(self):
         # Pass extra args not in TESTAGGREGATE.spec
         subagg = TESTSUBAGGREGATE(data="bar")
@@ -294,8 +303,28 @@ class AggregateTestCase(unittest.TestCase):
         with self.assertRaises(TypeError):
             Aggregate.from_etree(None)
 
+    def testFromEtreeUndefined(self):
+        # Tag must name an Aggregate subclass, not merely something that
+        # happens to live in the ofxtools.models namespace
+        for tag in ("NOTDEFINED", "CURRENCY_CODES"):
+            with self.subTest(tag=tag):
+                with self.assertRaises(OFXSpecError):
+                    Aggregate.from_etree(ET.Element(tag))
+
     def testGroom(self):
-        pass
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "METADATA").text = "metadata"
+        ET.SubElement(root, "INTU.BANKID").text = "12345678"
+
+        # Extended tags are removed from a copy; input is left intact
+        groomed = Aggregate.groom(root)
+        self.assertEqual([el.tag for el in groomed], ["METADATA"])
+        self.assertEqual([el.tag for el in root], ["METADATA", "INTU.BANKID"])
+
+        # Without extended tags, there's nothing to do
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "METADATA").text = "metadata"
+        self.assertIs(Aggregate.groom(root), root)
 
     def testUngroom(self):
         pass
@@ -38,7 +38,7 @@ class BpacctinfoTestCase(unittest.TestCase, base.TestAggregate):
 
     oneOfs = {"SVCSTATUS": ("AVAIL", "PEND", "ACTIVE")}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("BPACCTINFO")
@@ -59,7 +59,7 @@ class BillpubinfoTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["BILLPUB", "BILLID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("BILLPUBINFO")
@@ -85,7 +85,7 @@ class PmtinfoTestCase(unittest.TestCase, base.TestAggregate):
         "BILLPUBINFO",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("PMTINFO")
@@ -167,7 +167,7 @@ class DiscountTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["DSCRATE", "DSCAMT", "DSCDESC"]
     optionalElements = ["DSCDATE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("DISCOUNT")
@@ -194,7 +194,7 @@ class AdjustmentTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["ADJDESC", "ADJAMT"]
     optionalElements = ["ADJNO", "ADJDATE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("ADJUSTMENT")
@@ -220,7 +220,7 @@ class LineitemTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["LITMAMT", "LITMDESC"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("LINEITEM")
@@ -240,7 +240,7 @@ class InvoiceTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["INVNO", "INVTOTALAMT", "INVPAIDAMT", "INVDATE", "INVDESC"]
     optionalElements = ["DISCOUNT", "ADJUSTMENT"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("INVOICE")
@@ -274,7 +274,7 @@ class InvoiceTestCase(unittest.TestCase, base.TestAggregate):
 class ExtdpmtinvTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("EXTDPMTINV")
@@ -294,7 +294,7 @@ class ExtdpmtTestCase(unittest.TestCase, base.TestAggregate):
 
     oneOfs = {"EXTDPMTFOR": ("INDIVIDUAL", "BUSINESS")}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("EXTDPMT")
@@ -374,7 +374,7 @@ class ExtdpayeeTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["DAYSTOPAY"]
     oneOfs = {"IDSCOPE": ["GLOBAL", "USER"]}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -471,7 +471,7 @@ class PmtprcstsTestCase(unittest.TestCase, base.TestAggregate):
         )
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("PMTPRCSTS")
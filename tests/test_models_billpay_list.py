@@ -30,7 +30,7 @@ import test_models_billpay_common as bp_common
 class PayeerqTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         #  return next(cls.validSoup)
@@ -96,7 +96,7 @@ class PayeersTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["PAYEELSTID"]
     optionalElements = ["PAYEE", "BANKACCTTO", "EXTDPAYEE", "PAYACCT"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return list(cls.validSoup)[-1]
@@ -139,7 +139,7 @@ class PayeemodrqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["PAYEELSTID"]
     optionalElements = ["PAYEE", "BANKACCTTO", "PAYACCT"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return list(cls.validSoup)[-1]
@@ -180,7 +180,7 @@ class PayeemodrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["PAYEELSTID"]
     optionalElements = ["PAYEE", "BANKACCTTO", "PAYACCT", "EXTDPAYEE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PAYEEMODRS")
@@ -229,7 +229,7 @@ class PayeedelrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["PAYEELSTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PAYEEDELRQ")
@@ -247,7 +247,7 @@ class PayeedelrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["PAYEELSTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PAYEEDELRS")
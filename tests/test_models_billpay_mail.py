@@ -29,7 +29,7 @@ class PmtmailrqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["MAIL"]
     optionalElements = ["SRVRTID", "PMTINFO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("PMTMAILRQ")
@@ -54,7 +54,7 @@ class PmtmailrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["MAIL"]
     optionalElements = ["SRVRTID", "PMTINFO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("PMTMAILRS")
@@ -94,7 +94,7 @@ class PmtmailtrnrsTestCase(unittest.TestCase, base.TrnrsTestCase):
 
     wraps = PmtmailrsTestCase
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = cls.emptyBase
@@ -117,7 +117,7 @@ class PmtmailsyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 
     requiredElements = base.SyncrqTestCase.requiredElements + ["INCIMAGES", "USEHTML"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = ET.Element("PMTMAILSYNCRQ")
@@ -163,7 +163,7 @@ class PmtmailsyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 class PmtmailsyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = ET.Element("PMTMAILSYNCRS")
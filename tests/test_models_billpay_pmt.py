@@ -36,7 +36,7 @@ class PmtrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["PMTINFO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PMTRQ")
@@ -55,7 +55,7 @@ class PmtrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["SRVRTID", "PAYEELSTID", "CURDEF", "PMTINFO", "PMTPRCSTS"]
     oneOfs = {"CURDEF": CURRENCY_CODES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PMTRS")
@@ -89,7 +89,7 @@ class PmtmodrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID", "PMTINFO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PMTMODRQ")
@@ -109,7 +109,7 @@ class PmtmodrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["SRVRTID", "PMTINFO"]
     optionalElements = ["PMTPRCSTS"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PMTMODRS")
@@ -133,7 +133,7 @@ class PmtcancrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PMTCANCRQ")
@@ -151,7 +151,7 @@ class PmtcancrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PMTCANCRS")
@@ -245,7 +245,7 @@ class PmttrnrsTestCase(unittest.TestCase, base.TrnrsTestCase):
 
     wraps = PmtrsTestCase
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = cls.emptyBase
@@ -329,7 +329,7 @@ class PmtinqrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SRVRTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PMTINQRQ")
@@ -348,7 +348,7 @@ class PmtinqrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["SRVRTID", "PMTPRCSTS"]
     optionalElements = ["CHECKNUM"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PMTINQRS")
@@ -33,7 +33,7 @@ class RecpmtrqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["RECURRINST", "PMTINFO"]
     optionalElements = ["INITIALAMT", "FINALAMT"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("RECPMTRQ")
@@ -60,7 +60,7 @@ class RecpmtrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["RECURRINST", "PMTINFO"]
     optionalElements = ["INITIALAMT", "FINALAMT", "EXTDPAYEE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("RECPMTRS")
@@ -95,7 +95,7 @@ class RecpmtmodrqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["RECSRVRTID", "RECURRINST", "PMTINFO", "MODPENDING"]
     optionalElements = ["INITIALAMT", "FINALAMT"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("RECPMTMODRQ")
@@ -126,7 +126,7 @@ class RecpmtmodrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["RECSRVRTID", "RECURRINST", "PMTINFO", "MODPENDING"]
     optionalElements = ["INITIALAMT", "FINALAMT"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("RECPMTMODRS")
@@ -156,7 +156,7 @@ class RecpmtcancrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECSRVRTID", "CANPENDING"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("RECPMTCANCRQ")
@@ -175,7 +175,7 @@ class RecpmtcancrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["RECSRVRTID", "CANPENDING"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("RECPMTCANCRS")
@@ -210,7 +210,7 @@ class RecpmttrnrsTestCase(unittest.TestCase, base.TrnrsTestCase):
 
     wraps = RecpmtrsTestCase
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = cls.emptyBase
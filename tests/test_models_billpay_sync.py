@@ -30,7 +30,7 @@ class PmtsyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 
     requiredElements = base.SyncrqTestCase.requiredElements + ["BANKACCTFROM"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = ET.Element("PMTSYNCRQ")
@@ -72,7 +72,7 @@ class PmtsyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
 
     requiredElements = base.SyncrsTestCase.requiredElements + ["BANKACCTFROM"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = ET.Element("PMTSYNCRS")
@@ -115,7 +115,7 @@ class RecpmtsyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 
     requiredElements = base.SyncrqTestCase.requiredElements + ["BANKACCTFROM"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = ET.Element("RECPMTSYNCRQ")
@@ -157,7 +157,7 @@ class RecpmtsyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
 
     requiredElements = base.SyncrsTestCase.requiredElements + ["BANKACCTFROM"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = ET.Element("RECPMTSYNCRS")
@@ -198,7 +198,7 @@ class RecpmtsyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
 class PayeesyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = ET.Element("PAYEESYNCRQ")
@@ -234,7 +234,7 @@ class PayeesyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 class PayeesyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(self):
         root = ET.Element("PAYEESYNCRS")
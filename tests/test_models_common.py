@@ -38,7 +38,7 @@ class BalTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["DTASOF", "CURRENCY"]
     oneOfs = {"BALTYPE": ("DOLLAR", "PERCENT", "NUMBER"), "CURSYM": CURRENCY_CODES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("BAL")
@@ -67,7 +67,7 @@ class BalTestCase(unittest.TestCase, base.TestAggregate):
 class OfxelementTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("OFXELEMENT")
@@ -91,7 +91,7 @@ class OfxelementTestCase(unittest.TestCase, base.TestAggregate):
 class OfxextensionTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("OFXEXTENSION")
@@ -121,7 +121,7 @@ class TranListTestCase(unittest.TestCase, base.TestAggregate):
         del models.TESTAGGREGATE
         del models.TESTTRANLIST
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = ET.Element("TESTTRANLIST")
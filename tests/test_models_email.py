@@ -43,7 +43,7 @@ class MailTestCase(unittest.TestCase, base.TestAggregate):
         "USEHTML",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MAIL")
@@ -72,6 +72,19 @@ class MailTestCase(unittest.TestCase, base.TestAggregate):
             usehtml=False,
         )
 
+    def testGroomUngroomNoSideEffects(self):
+        # Renaming FROM <-> FRM leaves the input Element untouched
+        root = self.etree
+        groomed = MAIL.groom(root)
+        self.assertIsNotNone(root.find("./FROM"))
+        self.assertIsNone(root.find("./FRM"))
+        self.assertEqual(groomed.find("./FRM").text, "rolltide420@yahoo.com")
+        self.assertIsNone(groomed.find("./FROM"))
+
+        ungroomed = MAIL.ungroom(groomed)
+        self.assertIsNotNone(groomed.find("./FRM"))
+        self.assertEqual([el.tag for el in ungroomed], [el.tag for el in root])
+
     #  def testToEtree(cls):
     #  # "frm" gets translated back to FROM in etree
     #  root = MAIL(
@@ -114,7 +127,7 @@ class MailrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["MAIL"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MAILRQ")
@@ -132,7 +145,7 @@ class MailrsTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["MAIL"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MAILRS")
@@ -182,7 +195,7 @@ class MailsyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 
     requiredElements = base.SyncrqTestCase.requiredElements + ["INCIMAGES", "USEHTML"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MAILSYNCRQ")
@@ -272,7 +285,7 @@ class MailsyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 class MailsyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MAILSYNCRS")
@@ -329,7 +342,7 @@ class GetmimerqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["URL"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("GETMIMERQ")
@@ -347,7 +360,7 @@ class GetmimersTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["URL"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("GETMIMERS")
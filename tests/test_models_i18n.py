@@ -22,7 +22,7 @@ class CurrencyTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["CURRATE", "CURSYM"]
     oneOfs = {"CURSYM": CURRENCY_CODES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         etree = Element("CURRENCY")
@@ -37,7 +37,7 @@ class CurrencyTestCase(unittest.TestCase, base.TestAggregate):
 
 
 class OrigcurrencyTestCase(CurrencyTestCase):
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         etree = Element("ORIGCURRENCY")
@@ -64,7 +64,7 @@ class InvacctfromTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["BROKERID", "ACCTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVACCTFROM")
@@ -83,7 +83,7 @@ class InvaccttoTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["BROKERID", "ACCTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVACCTTO")
@@ -108,7 +108,7 @@ class InvacctinfoTestCase(unittest.TestCase, base.TestAggregate):
         "INVACCTTYPE": INVACCTTYPES,
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVACCTINFO")
@@ -140,7 +140,7 @@ class IncposTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["INCLUDE"]
     optionalElements = ["DTASOF"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INCPOS")
@@ -157,7 +157,7 @@ class IncposTestCase(unittest.TestCase, base.TestAggregate):
 class InvposlistTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVPOSLIST")
@@ -196,7 +196,7 @@ class InvbalTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["AVAILCASH", "MARGINBALANCE", "SHORTBALANCE"]
     optionalElements = ["BUYPOWER"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVBAL")
@@ -232,7 +232,7 @@ class Inv401kbalTestCase(unittest.TestCase, base.TestAggregate):
         "OTHERNONVEST",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INV401KBAL")
@@ -278,7 +278,7 @@ class MatchinfoTestCase(unittest.TestCase, base.TestAggregate):
         "BASEMATCHPCT",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MATCHINFO")
@@ -308,7 +308,7 @@ class ContribsecurityTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["SECID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CONTRIBSECURITY")
@@ -451,7 +451,7 @@ class ContribsecurityTestCase(unittest.TestCase, base.TestAggregate):
 class ContribinfoTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CONTRIBINFO")
@@ -480,7 +480,7 @@ class VestinfoTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["VESTPCT"]
     optionalElements = ["VESTDATE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("VESTINFO")
@@ -516,7 +516,7 @@ class LoaninfoTestCase(unittest.TestCase, base.TestAggregate):
     ]
     oneOfs = {"LOANPMTFREQ": LOANPMTFREQUENCIES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("LOANINFO")
@@ -573,7 +573,7 @@ class ContributionsTestCase(unittest.TestCase, base.TestAggregate):
         "OTHERNONVEST",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CONTRIBUTIONS")
@@ -616,7 +616,7 @@ class WithdrawalsTestCase(unittest.TestCase, base.TestAggregate):
         "OTHERNONVEST",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("WITHDRAWALS")
@@ -659,7 +659,7 @@ class EarningsTestCase(unittest.TestCase, base.TestAggregate):
         "OTHERNONVEST",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("EARNINGS")
@@ -694,7 +694,7 @@ class YeartodateTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["DTSTART", "DTEND"]
     optionalElements = ["CONTRIBUTIONS", "WITHDRAWALS", "EARNINGS"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("YEARTODATE")
@@ -723,7 +723,7 @@ class InceptodateTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["DTSTART", "DTEND"]
     optionalElements = ["CONTRIBUTIONS", "WITHDRAWALS", "EARNINGS"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INCEPTODATE")
@@ -752,7 +752,7 @@ class PeriodtodateTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["DTSTART", "DTEND"]
     optionalElements = ["CONTRIBUTIONS", "WITHDRAWALS", "EARNINGS"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PERIODTODATE")
@@ -781,7 +781,7 @@ class Inv401ksummaryTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["YEARTODATE"]
     optionalElements = ["INCEPTODATE", "PERIODTODATE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INV401KSUMMARY")
@@ -817,7 +817,7 @@ class Inv401kTestCase(unittest.TestCase, base.TestAggregate):
         "INV401KSUMMARY",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INV401K")
@@ -879,7 +879,7 @@ class InvposTestCase(unittest.TestCase, base.TestAggregate):
         "INV401KSOURCE": INV401KSOURCES,
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVPOS")
@@ -921,7 +921,7 @@ class PosdebtTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["INVPOS"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("POSDEBT")
@@ -955,7 +955,7 @@ class PosmfTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["UNITSSTREET", "UNITSUSER", "REINVDIV", "REINVCG"]
     oneOf = {"REINVDIV": ("Y", "N")}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("POSMF")
@@ -1001,7 +1001,7 @@ class PosoptTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["SECURED"]
     oneOfs = {"SECURED": ("NAKED", "COVERED")}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("POSOPT")
@@ -1034,7 +1034,7 @@ class PosotherTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["INVPOS"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("POSOTHER")
@@ -1070,7 +1070,7 @@ class PosstockTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["UNITSSTREET", "UNITSUSER", "REINVDIV"]
     oneOfs = {"REINVDIV": ("Y", "N")}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("POSSTOCK")
@@ -1111,7 +1111,7 @@ class InvstmtrqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["INVACCTFROM", "INCOO", "INCPOS", "INCBAL"]
     optionalElements = ["INCTRAN", "INC401K", "INC401KBAL", "INCTRANIMG"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVSTMTRQ")
@@ -1154,7 +1154,7 @@ class InvstmtrsTestCase(unittest.TestCase, base.TestAggregate):
         "MKTGINFO",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVSTMTRS")
@@ -1262,7 +1262,7 @@ class InvtranlistTestCase(unittest.TestCase, base.TranlistTestCase):
             test_txs.TransferTestCase,
         )
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVTRANLIST")
@@ -73,7 +73,7 @@ class OoTestCase(unittest.TestCase, base.TestAggregate):
         "INV401KSOURCE": INV401KSOURCES,
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OO")
@@ -133,7 +133,7 @@ class OobuydebtTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["OO", "AUCTION"]
     optionalElements = ["DTAUCTION"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OOBUYDEBT")
@@ -158,7 +158,7 @@ class OobuymfTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["OO", "BUYTYPE", "UNITTYPE"]
     oneOfs = {"BUYTYPE": BUYTYPES, "UNITTYPE": UNITTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OOBUYMF")
@@ -179,7 +179,7 @@ class OobuyoptTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["OO", "OPTBUYTYPE"]
     oneOfs = {"OPTBUYTYPE": OPTBUYTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OOBUYOPT")
@@ -199,7 +199,7 @@ class OobuyotherTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["OO", "UNITTYPE"]
     oneOfs = {"UNITTYPE": UNITTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OOBUYOTHER")
@@ -219,7 +219,7 @@ class OobuystockTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["OO", "BUYTYPE"]
     oneOfs = {"BUYTYPE": BUYTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OOBUYSTOCK")
@@ -239,7 +239,7 @@ class OoselldebtTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["OO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OOSELLDEBT")
@@ -258,7 +258,7 @@ class OosellmfTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["OO", "SELLTYPE", "UNITTYPE", "SELLALL"]
     oneOfs = {"SELLTYPE": SELLTYPES, "UNITTYPE": UNITTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OOSELLMF")
@@ -285,7 +285,7 @@ class OoselloptTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["OO", "OPTSELLTYPE"]
     oneOfs = {"OPTSELLTYPE": OPTSELLTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OOSELLOPT")
@@ -305,7 +305,7 @@ class OosellotherTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["OO", "UNITTYPE"]
     oneOfs = {"UNITTYPE": UNITTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OOSELLOTHER")
@@ -325,7 +325,7 @@ class OosellstockTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["OO", "SELLTYPE"]
     oneOfs = {"SELLTYPE": SELLTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OOSELLSTOCK")
@@ -345,7 +345,7 @@ class SwitchmfTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["OO", "SECID", "UNITTYPE", "SWITCHALL"]
     oneOfs = {"UNITTYPE": UNITTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SWITCHMF")
@@ -369,7 +369,7 @@ class SwitchmfTestCase(unittest.TestCase, base.TestAggregate):
 class InvoolistTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVOOLIST")
@@ -58,7 +58,7 @@ class InvbanktranTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["STMTTRN", "SUBACCTFUND"]
     oneOfs = {"SUBACCTFUND": INVSUBACCTS}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVBANKTRAN")
@@ -90,7 +90,7 @@ class InvtranTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["FITID", "DTTRADE"]
     optionalElements = ["SRVRTID", "DTSETTLE", "REVERSALFITID", "MEMO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVTRAN")
@@ -147,7 +147,7 @@ class InvbuyTestCase(unittest.TestCase, base.TestAggregate):
         "INV401KSOURCE": INV401KSOURCES,
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVBUY")
@@ -237,7 +237,7 @@ class InvsellTestCase(unittest.TestCase, base.TestAggregate):
         "INV401KSOURCE": INV401KSOURCES,
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVSELL")
@@ -305,7 +305,7 @@ class BuydebtTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["INVBUY"]
     optionalElements = ["ACCRDINT"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("BUYDEBT")
@@ -342,7 +342,7 @@ class BuymfTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["RELFITID"]
     oneOfs = {"BUYTYPE": BUYTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("BUYMF")
@@ -381,7 +381,7 @@ class BuyoptTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["INVBUY", "OPTBUYTYPE", "SHPERCTRCT"]
     oneOfs = {"OPTBUYTYPE": ("BUYTOOPEN", "BUYTOCLOSE")}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("BUYOPT")
@@ -419,7 +419,7 @@ class BuyotherTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["INVBUY"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("BUYOTHER")
@@ -454,7 +454,7 @@ class BuystockTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["INVBUY", "BUYTYPE"]
     oneOfs = {"BUYTYPE": BUYTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("BUYSTOCK")
@@ -497,7 +497,7 @@ class ClosureoptTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["RELFITID", "GAIN"]
     oneOfs = {"OPTACTION": ("EXERCISE", "ASSIGN", "EXPIRE"), "SUBACCTSEC": INVSUBACCTS}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CLOSUREOPT")
@@ -553,7 +553,7 @@ class IncomeTestCase(unittest.TestCase, base.TestAggregate):
         "INV401KSOURCE": INV401KSOURCES,
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INCOME")
@@ -611,7 +611,7 @@ class InvexpenseTestCase(unittest.TestCase, base.TestAggregate):
         "INV401KSOURCE": INV401KSOURCES,
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("INVEXPENSE")
@@ -655,7 +655,7 @@ class JrnlfundTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["INVTRAN", "SUBACCTTO", "SUBACCTFROM", "TOTAL"]
     oneOfs = {"SUBACCTTO": INVSUBACCTS, "SUBACCTFROM": INVSUBACCTS}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("JRNLFUND")
@@ -688,7 +688,7 @@ class JrnlsecTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["INVTRAN", "SECID", "SUBACCTTO", "SUBACCTFROM", "UNITS"]
     oneOfs = {"SUBACCTTO": INVSUBACCTS, "SUBACCTFROM": INVSUBACCTS}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("JRNLSEC")
@@ -726,7 +726,7 @@ class MargininterestTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["CURRENCY"]
     oneOfs = {"SUBACCTFUND": INVSUBACCTS}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MARGININTEREST")
@@ -786,7 +786,7 @@ class ReinvestTestCase(unittest.TestCase, base.TestAggregate):
         "INV401KSOURCE": INV401KSOURCES,
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("REINVEST")
@@ -849,7 +849,7 @@ class RetofcapTestCase(unittest.TestCase, base.TestAggregate):
         "INV401KSOURCE": INV401KSOURCES,
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("RETOFCAP")
@@ -895,7 +895,7 @@ class SelldebtTestCase(unittest.TestCase, base.TestAggregate):
 
     oneOfs = {"SELLREASON": ("CALL", "SELL", "MATURITY")}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SELLDEBT")
@@ -936,7 +936,7 @@ class SellmfTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["AVGCOSTBASIS", "RELFITID"]
     oneOfs = {"SELLTYPE": SELLTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SELLMF")
@@ -983,7 +983,7 @@ class SelloptTestCase(unittest.TestCase, base.TestAggregate):
         "SECURED": ("NAKED", "COVERED"),
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SELLOPT")
@@ -1028,7 +1028,7 @@ class SellotherTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["INVSELL"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SELLOTHER")
@@ -1062,7 +1062,7 @@ class SellstockTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["INVSELL", "SELLTYPE"]
     oneOfs = {"SELLTYPE": SELLTYPES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SELLSTOCK")
@@ -1110,7 +1110,7 @@ class SplitTestCase(unittest.TestCase, base.TestAggregate):
         "INV401KSOURCE": INV401KSOURCES,
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SPLIT")
@@ -1181,7 +1181,7 @@ class TransferTestCase(unittest.TestCase, base.TestAggregate):
         "INV401KSOURCE": INV401KSOURCES,
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("TRANSFER")
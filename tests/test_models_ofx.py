@@ -62,7 +62,7 @@ class OfxTestCase(unittest.TestCase, base.TestAggregate):
         "tax1095msgsrsv1",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OFX")
@@ -30,7 +30,7 @@ class ProfrqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["CLIENTROUTING", "DTPROFUP"]
     oneOfs = {"CLIENTROUTING": ("NONE", "SERVICE", "MSGSET")}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PROFRQ")
@@ -68,7 +68,7 @@ class SignoninfoTestCase(unittest.TestCase, base.TestAggregate):
         "CHARTYPE": ("ALPHAONLY", "NUMERICONLY", "ALPHAORNUMERIC", "ALPHAANDNUMERIC")
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SIGNONINFO")
@@ -120,7 +120,7 @@ class SignoninfoTestCase(unittest.TestCase, base.TestAggregate):
 class SignoninfolistTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SIGNONINFOLIST")
@@ -186,7 +186,7 @@ class ProfrsTestCase(unittest.TestCase, base.TestAggregate):
         SubElement(msgsetcore, "SPNAME").text = "Dewey Cheatham & Howe"
         return root
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PROFRS")
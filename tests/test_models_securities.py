@@ -44,7 +44,7 @@ class SecidTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["UNIQUEID", "UNIQUEIDTYPE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SECID")
@@ -64,7 +64,7 @@ class SecinfoTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["SECID", "SECNAME"]
     optionalElements = ["TICKER", "FIID", "RATING", "UNITPRICE", "DTASOF", "CURRENCY"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SECINFO")
@@ -207,7 +207,7 @@ class DebtinfoTestCase(unittest.TestCase, base.TestAggregate):
         "CALLTYPE": ("CALL", "PUT", "PREFUND", "MATURITY"),
     }
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("DEBTINFO")
@@ -260,7 +260,7 @@ class PortionTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
     OneOfs = {"ASSETCLASS": ASSETCLASSES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PORTION")
@@ -277,7 +277,7 @@ class PortionTestCase(unittest.TestCase, base.TestAggregate):
 class MfassetclassTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MFASSETCLASS")
@@ -300,7 +300,7 @@ class MfassetclassTestCase(unittest.TestCase, base.TestAggregate):
 class FiportionTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("FIPORTION")
@@ -317,7 +317,7 @@ class FiportionTestCase(unittest.TestCase, base.TestAggregate):
 class FimfassetclassTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("FIMFASSETCLASS")
@@ -350,7 +350,7 @@ class MfinfoTestCase(unittest.TestCase, base.TestAggregate):
     ]
     oneOfs = {"MFTYPE": ("OPENEND", "CLOSEEND", "OTHER")}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MFINFO")
@@ -386,7 +386,7 @@ class OptinfoTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["SECINFO", "OPTTYPE", "STRIKEPRICE", "DTEXPIRE", "SHPERCTRCT"]
     optionalElements = ["SECID", "ASSETCLASS", "FIASSETCLASS"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OPTINFO")
@@ -427,7 +427,7 @@ class OtherinfoTestCase(unittest.TestCase, base.TestAggregate):
     optionalElements = ["TYPEDESC", "ASSETCLASS", "FIASSETCLASS"]
     oneOfs = {"ASSETCLASS": ASSETCLASSES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OTHERINFO")
@@ -467,7 +467,7 @@ class StockinfoTestCase(unittest.TestCase, base.TestAggregate):
     ]
     oneOfs = {"ASSETCLASS": ASSETCLASSES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("STOCKINFO")
@@ -501,7 +501,7 @@ class StockinfoTestCase(unittest.TestCase, base.TestAggregate):
 class SeclistTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SECLIST")
@@ -527,7 +527,7 @@ class SeclistTestCase(unittest.TestCase, base.TestAggregate):
 class SecrqTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return next(cls.validSoup)
@@ -585,7 +585,7 @@ class SecrqTestCase(unittest.TestCase, base.TestAggregate):
 class SeclistrqTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SECLISTRQ")
@@ -602,7 +602,7 @@ class SeclistrqTestCase(unittest.TestCase, base.TestAggregate):
 class SeclistrsTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         return Element("SECLISTRS")
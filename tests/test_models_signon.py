@@ -42,7 +42,7 @@ class FiTestCase(unittest.TestCase, base.TestAggregate):
 
     optionalElements = ["FID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("FI")
@@ -62,7 +62,7 @@ class MfachallengeTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["MFAPHRASEID"]
     optionalElements = ["MFAPHRASELABEL"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MFACHALLENGE")
@@ -86,7 +86,7 @@ class MfachallengeaTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["MFAPHRASEID", "MFAPHRASEA"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MFACHALLENGEA")
@@ -117,7 +117,7 @@ class SonrqTestCase(unittest.TestCase, base.TestAggregate):
     ]
     oneOfs = {"LANGUAGE": LANG_CODES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SONRQ")
@@ -229,7 +229,7 @@ class SonrsTestCase(unittest.TestCase, base.TestAggregate):
     ]
     oneOfs = {"LANGUAGE": LANG_CODES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SONRS")
@@ -293,7 +293,7 @@ class PinchrqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["USERID", "NEWUSERPASS"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PINCHRQ")
@@ -313,7 +313,7 @@ class PinchrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["USERID"]
     optionalElements = ["DTCHANGED"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("PINCHRS")
@@ -365,7 +365,7 @@ class ChallengerqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["USERID"]
     optionalElements = ["FICERTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CHALLENGERQ")
@@ -384,7 +384,7 @@ class ChallengersTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["USERID", "NONCE", "FICERTID"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CHALLENGERS")
@@ -436,7 +436,7 @@ class MfachallengerqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["DTCLIENT"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MFACHALLENGERQ")
@@ -452,7 +452,7 @@ class MfachallengerqTestCase(unittest.TestCase, base.TestAggregate):
 class MfachallengersTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("MFACHALLENGERS")
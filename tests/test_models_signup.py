@@ -55,7 +55,7 @@ class ClientenrollTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["ACCTREQUIRED"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CLIENTENROLL")
@@ -73,7 +73,7 @@ class WebenrollTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["URL"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("WEBENROLL")
@@ -91,7 +91,7 @@ class OtherenrollTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["MESSAGE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("OTHERENROLL")
@@ -109,7 +109,7 @@ class AcctinfoTestCase(unittest.TestCase, base.TestAggregate):
 
     optionalElements = ["DESC", "PHONE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("ACCTINFO")
@@ -225,7 +225,7 @@ class AcctinforqTestCase(unittest.TestCase, base.TestAggregate):
 
     requiredElements = ["DTACCTUP"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("ACCTINFORQ")
@@ -244,7 +244,7 @@ class AcctinforsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["DTACCTUP"]
     optionalElements = ["ACCTINFO"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("ACCTINFORS")
@@ -346,7 +346,7 @@ class EnrollrqTestCase(unittest.TestCase, base.TestAggregate):
         SubElement(root, "DATEBIRTH").text = "20160705000000.000[0:GMT]"
         return root
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = cls.emptyBase
@@ -430,7 +430,7 @@ class EnrollrsTestCase(unittest.TestCase, base.TestAggregate):
 
     optionalElements = ["TEMPPASS", "USERID", "DTEXPIRE"]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("ENROLLRS")
@@ -454,7 +454,7 @@ class EnrolltrnrqTestCase(unittest.TestCase, base.TrnrqTestCase):
 
     wraps = EnrollrqTestCase
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("ENROLLTRNRQ")
@@ -480,7 +480,7 @@ class EnrolltrnrsTestCase(unittest.TestCase, base.TrnrsTestCase):
 
     wraps = EnrollrsTestCase
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("ENROLLTRNRS")
@@ -502,7 +502,7 @@ class EnrolltrnrsTestCase(unittest.TestCase, base.TrnrsTestCase):
 
 
 class SvcaddTestCase(unittest.TestCase, base.TestAggregate):
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SVCADD")
@@ -563,7 +563,7 @@ class SvcaddTestCase(unittest.TestCase, base.TestAggregate):
 
 
 class SvcchgTestCase(unittest.TestCase, base.TestAggregate):
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SVCCHG")
@@ -691,7 +691,7 @@ class SvcchgTestCase(unittest.TestCase, base.TestAggregate):
 
 
 class SvcdelTestCase(unittest.TestCase, base.TestAggregate):
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("SVCDEL")
@@ -757,7 +757,7 @@ class AcctrqTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["SVC"]
     oneOfs = {"SVC": SVCS}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("ACCTRQ")
@@ -820,7 +820,7 @@ class AcctrsTestCase(unittest.TestCase, base.TestAggregate):
     requiredElements = ["SVC", "SVCSTATUS"]
     oneOfs = {"SVC": SVCS, "SVCSTATUS": SVCSTATUSES}
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("ACCTRS")
@@ -918,7 +918,7 @@ class AccttrnrsTestCase(unittest.TestCase, base.TrnrsTestCase):
 class AcctsyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("ACCTSYNCRQ")
@@ -953,7 +953,7 @@ class AcctsyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 class AcctsyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("ACCTSYNCRS")
@@ -1004,7 +1004,7 @@ class ChguserinforqTestCase(unittest.TestCase, base.TestAggregate):
         "EMAIL",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CHGUSERINFORQ")
@@ -1063,7 +1063,7 @@ class ChguserinforsTestCase(unittest.TestCase, base.TestAggregate):
         "EMAIL",
     ]
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CHGUSERINFORS")
@@ -1139,7 +1139,7 @@ class ChguserinfotrnrsTestCase(unittest.TestCase, base.TrnrsTestCase):
 class ChguserinfosyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CHGUSERINFOSYNCRQ")
@@ -1174,7 +1174,7 @@ class ChguserinfosyncrqTestCase(unittest.TestCase, base.SyncrqTestCase):
 class ChguserinfosyncrsTestCase(unittest.TestCase, base.SyncrsTestCase):
     __test__ = True
 
-    @classproperty
+    @base.cached_etree
     @classmethod
     def etree(cls):
         root = Element("CHGUSERINFOSYNCRS")
@@ -280,6 +280,13 @@ class OneOfTestCase(unittest.TestCase, Base):
         value = "1"
         self.assertEqual(t.convert(t.unconvert(value)), value)
 
+    def test_shared_choices(self):
+        # Instances declared with the same choices share one set of them
+        t0 = self.type_("1", "2")
+        t1 = self.type_("1", "2", required=True)
+        self.assertIs(t0.valid, t1.valid)
+        self.assertIsNot(t0.valid, self.type_("1", "3").valid)
+
 
 class IntegerTestCase(unittest.TestCase, Base):
     type_ = ofxtools.Types.Integer
@@ -4,10 +4,12 @@
 import unittest
 import os
 import datetime
+import xml.etree.ElementTree as ET
 
 # local imports
 import ofxtools.utils
 from ofxtools.utils import (
+    cached_classproperty,
     fixpath,
     cusip_checksum,
     validate_cusip,
@@ -16,6 +18,7 @@ from ofxtools.utils import (
     validate_isin,
     cusip2isin,
     sedol2isin,
+    retag_child,
 )
 
 
@@ -29,6 +32,51 @@ class FixpathTestCase(unittest.TestCase):
         self.assertEqual(fixpath(test_path), "{}/bar".format(home))
 
 
+class CachedClasspropertyTestCase(unittest.TestCase):
+    def test_cached_per_class(self):
+        """
+        utils.cached_classproperty computes its value once for each class
+        """
+        calls = []
+
+        class Base:
+            @cached_classproperty
+            @classmethod
+            def name(cls):
+                calls.append(cls)
+                return cls.__name__
+
+        class Sub(Base):
+            pass
+
+        self.assertEqual(Base.name, "Base")
+        self.assertEqual(Base.name, "Base")
+        self.assertEqual(Sub.name, "Sub")
+        self.assertEqual(Sub().name, "Sub")
+        self.assertEqual(calls, [Base, Sub])
+
+
+class RetagChildTestCase(unittest.TestCase):
+    def test_retag_child(self):
+        """
+        utils.retag_child() returns a copy with one SubElement retagged,
+        leaving the input alone
+        """
+        root = ET.Element("MFINFO")
+        secinfo = ET.SubElement(root, "SECINFO")
+        yld = ET.SubElement(root, "YIELD")
+        yld.text = "5.0"
+
+        retagged = retag_child(root, yld, "YLD")
+        self.assertIsNot(retagged, root)
+        self.assertEqual([el.tag for el in retagged], ["SECINFO", "YLD"])
+        self.assertEqual(retagged[1].text, "5.0")
+        self.assertEqual([el.tag for el in root], ["SECINFO", "YIELD"])
+        self.assertEqual(yld.tag, "YIELD")
+        # Untouched SubElements are shared, not copied
+        self.assertIs(retagged[0], secinfo)
+
+
 class CusipTestCase(unittest.TestCase):
     def test_cusip_checksum(self):
         self.assertEqual(cusip_checksum("08467010"), "8")